@@ -6,7 +6,6 @@ from app.utils.versioning import get_version_headers, SUPPORTED_VERSIONS, LATEST
 import logging
 from werkzeug.exceptions import HTTPException
 from app.exceptions import APIRequestError
-from app.controllers.rephrase import rephrase_bp
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +61,9 @@ def create_app(config_name='development'):
     # Global request logging
     @app.before_request
     def log_request_info():
+        # Skip copying headers and reading the body unless debug is on
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         logger.debug('Headers: %s', dict(request.headers))
         logger.debug('Body: %s', request.get_data())
         logger.debug('Query Params: %s', dict(request.args))
@@ -1,24 +1,24 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, FrozenSet
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ParamConfig:
     required: bool
     type: type
     default: Any = None
     min_value: Any = None
     max_value: Any = None
-    allowed_values: List[Any] = None
+    allowed_values: FrozenSet[Any] = None
 
 
 # Move the validation sets to the top of the file
-VALID_STYLES = {'professional', 'casual', 'technical',
-                'formal', 'elaborate', 'explain', 'example', 'detail'}
-VALID_TONES = {'technical', 'conversational',
-               'academic', 'informal', 'friendly', 'strict'}
-VALID_ASPECTS = {'context', 'examples', 'implications',
-                 'technical_details', 'counterarguments'}
+VALID_STYLES = frozenset({'professional', 'casual', 'technical',
+                          'formal', 'elaborate', 'explain', 'example', 'detail'})
+VALID_TONES = frozenset({'technical', 'conversational',
+                         'academic', 'informal', 'friendly', 'strict'})
+VALID_ASPECTS = frozenset({'context', 'examples', 'implications',
+                           'technical_details', 'counterarguments'})
 
 # Shared parameters across ALL endpoints
 SHARED_PARAMS = {
@@ -26,12 +26,12 @@ SHARED_PARAMS = {
         required=False,
         type=str,
         default='professional',
-        allowed_values=list(VALID_STYLES)
+        allowed_values=VALID_STYLES
     ),
     'tone': ParamConfig(
         required=False,
         type=str,
-        allowed_values=list(VALID_TONES)
+        allowed_values=VALID_TONES
     ),
     'aspects': ParamConfig(
         required=False,
@@ -113,7 +113,7 @@ def validate_params(operation: str, params: Dict[str, Any]) -> List[Dict[str, st
     operation_params = ENDPOINT_PARAMS.get(operation, {})
 
     # Check for unknown parameters
-    unknown_params = set(params.keys()) - set(operation_params.keys())
+    unknown_params = params.keys() - operation_params.keys()
     if unknown_params:
         warnings.append({
             "code": "unknown_params",
@@ -157,7 +157,7 @@ def validate_params(operation: str, params: Dict[str, Any]) -> List[Dict[str, st
         if config.allowed_values and value not in config.allowed_values:
             warnings.append({
                 "code": "invalid_value",
-                "message": f"Invalid value for {param_name}. Allowed values: {config.allowed_values}"
+                "message": f"Invalid value for {param_name}. Allowed values: {sorted(config.allowed_values)}"
             })
 
     return warnings
@@ -22,13 +22,13 @@ DEFAULT_VERSIONS = 1    # Default number of versions per length
 
 
 # Valid options for API parameters
-VALID_STYLES = {'elaborate', 'explain', 'example', 'detail'}
-VALID_TONES = {'academic', 'conversational', 'technical'}
-VALID_ASPECTS = {'context', 'examples', 'implications',
-                 'technical_details', 'counterarguments'}
+VALID_STYLES = frozenset({'elaborate', 'explain', 'example', 'detail'})
+VALID_TONES = frozenset({'academic', 'conversational', 'technical'})
+VALID_ASPECTS = frozenset({'context', 'examples', 'implications',
+                           'technical_details', 'counterarguments'})
 
 # Valid options for fragment styles
-VALID_FRAGMENT_STYLES = {'bullet', 'narrative', 'outline'}
+VALID_FRAGMENT_STYLES = frozenset({'bullet', 'narrative', 'outline'})
 
 # Operation modes
 MODES = {
@@ -74,7 +74,7 @@ def compress_text():
             return jsonify(response), 500
 
         logger.info("Successfully received AI response")
-        logger.debug(f"Raw AI response: {response}")
+        logger.debug("Raw AI response: %s", response)
 
         # Parse and validate response
         logger.info("Parsing and validating response...")
@@ -90,7 +90,7 @@ def compress_text():
         )
 
         logger.info("Compression completed successfully")
-        logger.debug(f"Formatted response: {formatted_response}")
+        logger.debug("Formatted response: %s", formatted_response)
 
         return jsonify(formatted_response), 200
 
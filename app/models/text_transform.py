@@ -2,26 +2,26 @@ from dataclasses import dataclass
 from typing import List, Dict, Any, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class Version:
     text: str
     final_tokens: int
     final_percentage: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Length:
     target_percentage: int
     target_tokens: int
     versions: List[Version]
 
 
-@dataclass
+@dataclass(slots=True)
 class Fragment:
     lengths: List[Length]
 
 
-@dataclass
+@dataclass(slots=True)
 class TransformationResponse:
     fragments: List[Fragment]
     metadata: Dict[str, Any]
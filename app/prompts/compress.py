@@ -3,9 +3,6 @@ Compression prompts defining strategies and templates for text compression opera
 System prompts focus on compression strategies while user messages handle specific requirements.
 """
 
-from typing import List, Tuple, Dict, Any
-import json
-
 # Core compression strategies for different operation modes
 COMPRESS_BASE = """Generate shorter versions of text while preserving core meaning. Respond in JSON format:
 
@@ -216,5 +213,3 @@ IMPORTANT:
 - Keep fragments independent
 - Preserve core meaning{tone_str}{aspects_str}"""
 }
-
-# Reuse the format_version_details function from expand.py
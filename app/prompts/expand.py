@@ -3,10 +3,6 @@ Expansion prompts defining strategies and templates for text expansion operation
 System prompts focus on expansion strategies while user messages handle specific requirements.
 """
 
-from typing import List, Tuple, Dict, Any
-import json
-
-
 # Core expansion strategies for different operation modes
 EXPAND_BASE = """Generate expanded versions of text following these rules and respond in JSON format:
 
@@ -222,43 +218,3 @@ IMPORTANT:
 - Keep fragments independent
 - Preserve original meaning{tone_str}{aspects_str}"""
 }
-
-# Helper functions for formatting version details
-
-
-def format_version_details(
-    original_tokens: int | List[int],
-    target_lengths: List[int],
-    versions_per_length: int,
-    mode: str = 'base'
-) -> str:
-    """Format example structure showing required lengths and versions"""
-    def create_length_structure(tokens: int) -> List[Dict[str, Any]]:
-        return [
-            {
-                "target_percentage": length,
-                "target_tokens": round(tokens * length / 100),
-                "versions": [
-                    {"text": f"expanded version {
-                        v+1} ({length}% of original length, approx. {round(tokens * length / 100)} tokens)"}
-                    for v in range(versions_per_length)
-                ]
-            }
-            for length in target_lengths
-        ]
-
-    if mode == 'fragment':
-        structure = {
-            "fragments": [
-                {
-                    "lengths": create_length_structure(tokens)
-                }
-                for i, tokens in enumerate(original_tokens)
-            ]
-        }
-    else:
-        structure = {
-            "lengths": create_length_structure(original_tokens)
-        }
-
-    return json.dumps(structure, indent=2)
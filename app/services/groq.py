@@ -36,8 +36,8 @@ def get_ai_completion(
     try:
         # Log request
         logger.info("Sending request to Groq API")
-        logger.debug(f"System prompt: {system_prompt}")
-        logger.debug(f"User message: {user_message}")
+        logger.debug("System prompt: %s", system_prompt)
+        logger.debug("User message: %s", user_message)
 
         # Validate and adjust temperature
         temp = temperature if temperature is not None else DEFAULT_TEMPERATURE
@@ -56,7 +56,7 @@ def get_ai_completion(
         # Extract and parse response
         content = response.choices[0].message.content
         logger.info("Received response from Groq API")
-        logger.debug(f"Raw AI response: {content}")
+        logger.debug("Raw AI response: %s", content)
 
         # Parse JSON response with enhanced error handling
         try:
@@ -73,12 +73,12 @@ def get_ai_completion(
                 result = json.loads(repaired)
                 logger.info("Successfully repaired and parsed JSON")
 
-            logger.debug(f"Final parsed JSON: {result}")
+            logger.debug("Final parsed JSON: %s", result)
             return result
 
         except (json.JSONDecodeError, Exception) as e:
             logger.error(f"Failed to parse JSON response: {e}")
-            logger.debug(f"Invalid JSON content: {content[:200]}...")
+            logger.debug("Invalid JSON content: %s...", content[:200])
             return {
                 "error": {
                     "code": "parse_error",
@@ -41,7 +41,7 @@ def clean_generated_text(text: str) -> str:
 
 def parse_ai_response(response_text: str) -> dict:
     """Parse AI response and ensure it's valid JSON"""
-    logger.debug(f"Parsing AI response: {response_text}")
+    logger.debug("Parsing AI response: %s", response_text)
 
     try:
         # Try to find JSON-like content
@@ -50,7 +50,7 @@ def parse_ai_response(response_text: str) -> dict:
         if start >= 0 and end > start:
             json_str = response_text[start:end]
             result = json.loads(json_str)
-            logger.debug(f"Parsed JSON: {result}")
+            logger.debug("Parsed JSON: %s", result)
 
             # Handle different response formats
             if 'fragments' in result:
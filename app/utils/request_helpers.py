@@ -14,10 +14,12 @@ def init_request_helpers(app):
         # Merge query params and JSON body
         if request.args:
             g.params.update(request.args.to_dict())
-        if request.is_json and request.get_json():
-            g.params.update(request.get_json())
+        if request.is_json:
+            data = request.get_json()
+            if data:
+                g.params.update(data)
 
-        logger.debug(f"Initialized request context with params: {g.params}")
+        logger.debug("Initialized request context with params: %s", g.params)
 
 
 def get_param(name: str, default=None, required=False):
@@ -13,11 +13,11 @@ from app.config.endpoint_params import VALID_STYLES, VALID_TONES, VALID_ASPECTS
 
 logger = logging.getLogger(__name__)
 
-VALID_PARAMS = {
+VALID_PARAMS = frozenset({
     'target_percentage', 'target_percentages', 'start_percentage',
     'steps_percentage', 'versions', 'style', 'tone', 'aspects',
     'fragment_style', 'content'
-}
+})
 
 
 class RequestValidator:
@@ -26,11 +26,11 @@ class RequestValidator:
         """Main validation entry point for text transformation requests"""
         # Check for unknown parameters
         warnings = []
-        unknown_params = set(params.keys()) - VALID_PARAMS
+        unknown_params = params.keys() - VALID_PARAMS
         if unknown_params:
             warnings.extend([
                 {
-                    "field": f"{param}",
+                    "field": param,
                     "code": "validation_warning",
                     "message": f"Unsupported parameter: {param}"
                 }
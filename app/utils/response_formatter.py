@@ -40,13 +40,14 @@ class ResponseFormatter:
             # Special handling for rephrase operation
             if operation == 'rephrase':
                 processed_fragments = []
+                ai_fragments = (ai_response.get('fragments', []) or []) if ai_response else None
+                versions_requested = request_params.get('versions', DEFAULT_VERSIONS)
                 for i, original_text in enumerate(content_list):
-                    fragment = (ai_response.get('fragments', []) or [])[
-                        i] if ai_response else None
+                    fragment = ai_fragments[i] if ai_response else None
                     if not fragment or 'lengths' not in fragment:
                         processed_fragments.append({
                             'lengths': [{
-                                'versions': [{'text': original_text}] * request_params.get('versions', DEFAULT_VERSIONS)
+                                'versions': [{'text': original_text}] * versions_requested
                             }]
                         })
                         continue
@@ -58,7 +59,7 @@ class ResponseFormatter:
                     'metadata': {
                         'mode': 'fixed',
                         'operation': 'rephrase',
-                        'versions_requested': request_params.get('versions', DEFAULT_VERSIONS),
+                        'versions_requested': versions_requested,
                         'style': request_params.get('style', 'professional'),
                         'warnings': warnings if warnings else None
                     }
@@ -88,12 +89,13 @@ class ResponseFormatter:
                     "tolerance": 0.2
                 }
             }
+            tolerance = validation['lengths']['tolerance']
+            ai_fragments = (ai_response.get('fragments', []) or []) if ai_response else None
 
             # Process each fragment
             for i, original_text in enumerate(content_list):
                 try:
-                    fragment = (ai_response.get('fragments', []) or [])[
-                        i] if ai_response else None
+                    fragment = ai_fragments[i] if ai_response else None
                     if not fragment or 'lengths' not in fragment:
                         warnings.append({
                             "key": f"{i}",
@@ -101,10 +103,12 @@ class ResponseFormatter:
                             "message": f"Fragment {i+1} missing or invalid - using original"
                         })
                         processed_fragments.append(
-                            ResponseFormatter._create_placeholder_fragment(original_text, request_params))
+                            ResponseFormatter._create_placeholder_fragment(
+                                original_text, request_params, original_tokens[i]))
                         continue
 
                     lengths = []
+                    fragment_tokens = original_tokens[i]
 
                     # Use calculated target percentages instead of just the target
                     for j, target_percentage in enumerate(target_percentages):
@@ -118,12 +122,12 @@ class ResponseFormatter:
                                     "message": f"Fragment {i+1} length {j+1} missing - using original"
                                 })
                                 lengths.append(ResponseFormatter._create_placeholder_length(
-                                    target_percentage, original_text, request_params))
+                                    target_percentage, original_text, request_params, fragment_tokens))
                                 continue
 
                             versions = []
                             target_tokens = round(
-                                original_tokens[i] * target_percentage / 100)
+                                fragment_tokens * target_percentage / 100)
 
                             # Process versions
                             for k, version in enumerate(length_config.get('versions', [])):
@@ -135,16 +139,17 @@ class ResponseFormatter:
                                             "message": f"Fragment {i+1} length {j+1} version {k+1} missing - using original"
                                         })
                                         version = {'text': original_text}
-
-                                    final_tokens = count_tokens(
-                                        version['text'])
+                                        final_tokens = fragment_tokens
+                                    else:
+                                        final_tokens = count_tokens(
+                                            version['text'])
                                     final_percentage = round(
-                                        (final_tokens / original_tokens[i]) * 100, 1)
+                                        (final_tokens / fragment_tokens) * 100, 1)
 
                                     # Check if version is within tolerance
                                     deviation = abs(
                                         final_percentage - target_percentage) / target_percentage
-                                    if deviation > validation['lengths']['tolerance']:
+                                    if deviation > tolerance:
                                         warnings.append({
                                             "key": f"{i}.{j}.{k}",
                                             "code": "target_deviation",
@@ -230,22 +235,27 @@ class ResponseFormatter:
             }
 
     @staticmethod
-    def _create_placeholder_fragment(original_text: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_placeholder_fragment(original_text: str, params: Dict[str, Any],
+                                     original_tokens: Optional[int] = None) -> Dict[str, Any]:
         """Create a complete placeholder fragment with all required lengths"""
         target_percentages = ResponseFormatter._get_target_percentages(
             params, 'expand')  # Default to expand
+        if original_tokens is None:
+            original_tokens = count_tokens(original_text)
         return {
             'lengths': [
                 ResponseFormatter._create_placeholder_length(
-                    percentage, original_text, params)
+                    percentage, original_text, params, original_tokens)
                 for percentage in target_percentages
             ]
         }
 
     @staticmethod
-    def _create_placeholder_length(target_percentage: int, original_text: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_placeholder_length(target_percentage: int, original_text: str, params: Dict[str, Any],
+                                   original_tokens: Optional[int] = None) -> Dict[str, Any]:
         """Create a placeholder length with original text for all versions"""
-        original_tokens = count_tokens(original_text)
+        if original_tokens is None:
+            original_tokens = count_tokens(original_text)
         return {
             'target_percentage': target_percentage,
             'target_tokens': round(original_tokens * target_percentage / 100),
@@ -1,5 +1,6 @@
 from typing import List, Dict, Union, Optional, Tuple, Any
 from dataclasses import dataclass
+from functools import lru_cache
 import json
 import logging
 from app.exceptions import APIRequestError
@@ -17,7 +18,7 @@ from app.utils.request_validator import RequestValidator
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
     code: str
     message: str
@@ -26,40 +27,61 @@ class ValidationError:
 def format_version_details(
     content: Union[str, List[str]],
     target_configs: List[Dict[str, Any]],
-    is_fragments: bool
+    is_fragments: bool,
+    original_tokens: Optional[Union[int, List[int]]] = None
 ) -> str:
     """
     Format version details for prompt templates.
     Works for both expansion and compression operations.
+    Token counts of the original content are computed unless passed in.
     """
-    def create_length_structure(tokens: int, configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        return [
-            {
-                "target_percentage": config["target_percentage"],
-                "target_tokens": round(tokens * config["target_percentage"] / 100),
+    if original_tokens is None:
+        original_tokens = [count_tokens(f) for f in content] if is_fragments else count_tokens(content)
+
+    return _render_version_details(
+        tuple(original_tokens) if is_fragments else original_tokens,
+        tuple(
+            (config["target_percentage"],
+             config.get("versions_per_length", config.get("versions", 1)))
+            for config in target_configs
+        ),
+        is_fragments
+    )
+
+
+@lru_cache(maxsize=512)
+def _render_version_details(
+    original_tokens: Union[int, Tuple[int, ...]],
+    length_configs: Tuple[Tuple[int, int], ...],
+    is_fragments: bool
+) -> str:
+    """Render version details JSON, cached per token counts and (percentage, versions) pairs"""
+    def create_length_structure(tokens: int) -> List[Dict[str, Any]]:
+        lengths = []
+        for percentage, versions in length_configs:
+            target_tokens = round(tokens * percentage / 100)
+            lengths.append({
+                "target_percentage": percentage,
+                "target_tokens": target_tokens,
                 "versions": [
-                    {"text": f"generated text for version {i+1} ({config['target_percentage']}% of original length, approx. {
-                        round(tokens * config['target_percentage'] / 100)} tokens)"}
-                    for i in range(config.get("versions_per_length", config.get("versions", 1)))
+                    {"text": f"generated text for version {i+1} ({percentage}% of original length, approx. {target_tokens} tokens)"}
+                    for i in range(versions)
                 ]
-            }
-            for config in configs
-        ]
+            })
+        return lengths
 
     if is_fragments:
-        original_tokens = [count_tokens(f) for f in content]
         structure = {
             "fragments": [
                 {
-                    "lengths": create_length_structure(tokens, target_configs)
+                    "lengths": create_length_structure(tokens)
                 }
                 for tokens in original_tokens
             ]
         }
     else:
-        original_tokens = count_tokens(content)
         structure = {
-            "lengths": create_length_structure(original_tokens, target_configs)
+            "lengths": create_length_structure(original_tokens)
         }
 
     return json.dumps(structure, indent=2)
@@ -68,6 +90,12 @@ def format_version_details(
 class TransformationRequest:
     """Handles text transformation request logic and prompt generation"""
 
+    __slots__ = (
+        'content', 'params', 'warnings', 'is_fragments', 'operation',
+        'is_expansion', 'base_operation', 'required_operation',
+        'target_percentages', '_original_tokens'
+    )
+
     # Operation types
     SINGLE = 'SINGLE'
     FIXED = 'FIXED'
@@ -80,6 +108,7 @@ class TransformationRequest:
         self.warnings = warnings or []
         self.is_fragments = isinstance(content, list)
         self.operation = operation
+        self._original_tokens = None
 
         match operation:
             case 'rephrase':
@@ -90,6 +119,16 @@ class TransformationRequest:
                 raise APIRequestError(f"Unknown operation: {
                                       operation}", status=400)
 
+    @property
+    def original_tokens(self) -> Union[int, List[int]]:
+        """Token count of the original content (one per fragment), counted once"""
+        if self._original_tokens is None:
+            self._original_tokens = (
+                [count_tokens(f) for f in self.content] if self.is_fragments
+                else count_tokens(self.content)
+            )
+        return self._original_tokens
+
     def _init_rephrase(self):
         """Initialize for rephrase operation"""
         self.is_expansion = False
@@ -236,10 +275,6 @@ class TransformationRequest:
                 'No valid target percentages could be calculated'
             )
 
-        # Extract just the percentage values from the target configs
-        percentages = [config["target_percentage"]
-                       for config in self.target_percentages]
-
         # Validate versions per length
         for config in self.target_percentages:
             if not 1 <= config["versions_per_length"] <= MAX_VERSIONS:
@@ -298,8 +333,7 @@ class TransformationRequest:
             case 'expand' | 'compress':
                 messages = EXPAND_MESSAGES if self.is_expansion else COMPRESS_MESSAGES
                 template_key = 'fragment' if self.is_fragments else self._get_mode()
-                original_tokens = count_tokens(
-                    self.content[0] if self.is_fragments else self.content)
+                original_tokens = self.original_tokens[0] if self.is_fragments else self.original_tokens
 
                 return messages[template_key].format(
                     text=text,
@@ -314,7 +348,8 @@ class TransformationRequest:
                     version_details=format_version_details(
                         self.content,
                         self.target_percentages,
-                        self.is_fragments
+                        self.is_fragments,
+                        self.original_tokens
                     )
                 )
 
@@ -331,7 +366,11 @@ class TransformationRequest:
                         "Response missing 'fragments' key - reconstructing structure")
 
                 expected_fragments = len(self.content)
-                actual_fragments = len(response.get('fragments', []))
+                response_fragments = response['fragments']
+                actual_fragments = len(response_fragments)
+                expected_lengths = len(self.target_percentages)
+                expected_versions = self.params.get(
+                    'versions', DEFAULT_VERSIONS)
                 processed_fragments = []
 
                 for i in range(expected_fragments):
@@ -344,7 +383,7 @@ class TransformationRequest:
                                 self._create_placeholder_fragment(i))
                             continue
 
-                        fragment = response['fragments'][i]
+                        fragment = response_fragments[i]
                         if 'lengths' not in fragment:
                             warnings.append(
                                 f"Fragment {i+1} missing lengths - using original")
@@ -353,7 +392,6 @@ class TransformationRequest:
                             continue
 
                         # Handle missing or insufficient lengths
-                        expected_lengths = len(self.target_percentages)
                         actual_lengths = len(fragment['lengths'])
 
                         if actual_lengths < expected_lengths:
@@ -377,15 +415,14 @@ class TransformationRequest:
                                     {'text': self.content[i]}]
                                 continue
 
-                            expected_versions = self.params.get(
-                                'versions', DEFAULT_VERSIONS)
-                            actual_versions = len(length_config['versions'])
+                            versions = length_config['versions']
+                            actual_versions = len(versions)
 
                             if actual_versions < expected_versions:
                                 warnings.append(f"Fragment {
                                                 i+1}, length {j+1} has fewer versions than expected ({actual_versions}/{expected_versions})")
                                 # Pad with original text for missing versions
-                                length_config['versions'].extend([
+                                versions.extend([
                                     {'text': self.content[i]}
                                     for _ in range(actual_versions, expected_versions)
                                 ])
@@ -415,11 +452,12 @@ class TransformationRequest:
                 if 'lengths' not in response:
                     raise ValueError("Missing 'lengths' key in response")
 
-                if len(response['lengths']) < len(self.target_percentages):
-                    raise ValueError(f"Expected at least {len(
-                        self.target_percentages)} lengths, got {len(response['lengths'])}")
-                response['lengths'] = response['lengths'][:len(
-                    self.target_percentages)]
+                expected_lengths = len(self.target_percentages)
+                actual_lengths = len(response['lengths'])
+                if actual_lengths < expected_lengths:
+                    raise ValueError(
+                        f"Expected at least {expected_lengths} lengths, got {actual_lengths}")
+                response['lengths'] = response['lengths'][:expected_lengths]
 
                 # Validate each length configuration
                 for i, length_config in enumerate(response['lengths']):
@@ -479,8 +517,8 @@ class TransformationRequest:
             return
 
         # Original validation logic for expand/compress
-        original_tokens = count_tokens(
-            self.content[fragment_idx] if fragment_idx is not None else self.content
+        original_tokens = (
+            self.original_tokens[fragment_idx] if fragment_idx is not None else self.original_tokens
         )
         target_percentage = self.target_percentages[length_idx]['target_percentage']
         target_tokens = round(original_tokens * target_percentage / 100)
@@ -8,14 +8,17 @@ LATEST_VERSION = API_VERSION
 SUPPORTED_VERSIONS = [API_VERSION]
 DEPRECATED_VERSIONS: Dict[str, datetime] = {}  # version -> end of life date
 
+# Static headers sent with every versioned response
+VERSION_HEADERS = {
+    "X-API-Version": API_VERSION,
+    "X-API-Latest-Version": LATEST_VERSION,
+    "X-API-Supported-Versions": ",".join(SUPPORTED_VERSIONS)
+}
+
 
 def get_version_headers(requested_version: Optional[str] = None) -> Dict[str, str]:
     """Generate version-related response headers."""
-    headers = {
-        "X-API-Version": API_VERSION,
-        "X-API-Latest-Version": LATEST_VERSION,
-        "X-API-Supported-Versions": ",".join(SUPPORTED_VERSIONS)
-    }
+    headers = VERSION_HEADERS.copy()
 
     # Add deprecation warning if applicable
     if requested_version in DEPRECATED_VERSIONS: